@@ -0,0 +1,213 @@
+"""
+AsyncTorRequestsWrapper - An asyncio wrapper for making HTTP requests through Tor
+
+Asynchronous counterpart of TorRequestsWrapper. All requests share a single
+aiohttp session routed through the Tor SOCKS proxy, so many requests can be
+in flight at once on one event loop instead of blocking a thread each.
+
+Installation:
+-------------
+Required packages:
+    pip install aiohttp aiohttp-socks
+
+You must also have Tor running on your system:
+    - Either Tor Browser (default port 9150)
+    - Or Tor service (default port 9050)
+
+Basic Usage:
+-----------
+1. Simple decorator approach:
+
+    import asyncio
+    from async_tor_requests import async_tor_request
+
+    @async_tor_request
+    async def fetch_webpage(tor, url):
+        response = await tor.get(url)
+        return await response.text()
+
+    content = asyncio.run(fetch_webpage("https://example.com"))
+    print(content)
+
+2. Direct class usage:
+
+    import asyncio
+    from async_tor_requests import AsyncTorRequestsWrapper
+
+    async def main():
+        async with AsyncTorRequestsWrapper() as tor:
+            if await tor.check_tor_connection():
+                responses = await tor.gather([
+                    ('get', 'https://example.com'),
+                    ('post', 'https://example.com/api', {'json': {'key': 'value'}}),
+                ])
+                for response in responses:
+                    print(response.status)
+
+    asyncio.run(main())
+
+Available HTTP Methods:
+---------------------
+- await get(url, **kwargs)
+- await post(url, **kwargs)
+- await put(url, **kwargs)
+- await delete(url, **kwargs)
+- await gather(reqs)
+
+All methods support standard aiohttp request kwargs.
+"""
+
+import asyncio
+from functools import wraps
+
+import aiohttp
+from aiohttp_socks import ProxyConnector, ProxyError
+
+class AsyncTorRequestsWrapper:
+    def __init__(self, tor_ports=(9150, 9050), timeout=10, limit=100, limit_per_host=20):
+        """
+        Initialize the AsyncTorRequestsWrapper.
+
+        Args:
+            tor_ports (iterable): Ports to try for Tor connection, in order. Default (9150, 9050)
+            timeout (int): Total request timeout in seconds. Default 10
+            limit (int): Maximum number of simultaneous connections. Default 100
+            limit_per_host (int): Maximum simultaneous connections per host. Default 20
+        """
+        self.tor_ports = tuple(tor_ports)
+        self.timeout = timeout
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ip_check_url = 'https://api.ipify.org?format=json'
+        self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying session and release pooled connections"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _create_session(self, port):
+        connector = ProxyConnector.from_url(
+            f'socks5://127.0.0.1:{port}',
+            rdns=True,
+            limit=self.limit,
+            limit_per_host=self.limit_per_host
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    async def check_tor_connection(self):
+        """
+        Verify Tor connection by comparing direct IP with Tor IP.
+
+        Returns:
+            bool: True if connected to Tor, False otherwise
+        """
+        direct_ip = await self._get_direct_ip()
+        if not direct_ip:
+            print("Warning: Unable to get direct IP. Continuing with Tor check...")
+
+        for port in self.tor_ports:
+            session = self._create_session(port)
+            try:
+                tor_ip = await self._get_tor_ip(session)
+                if tor_ip and tor_ip != direct_ip:
+                    print(f"Connected to Tor! Tor IP: {tor_ip}")
+                    await self.close()
+                    self.session = session
+                    return True
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError, ProxyError) as e:
+                print(f"Error checking Tor connection on port {port}: {e}")
+            except (ValueError, KeyError, TypeError) as e:
+                print(f"Invalid IP check response on port {port}: {e!r}")
+            finally:
+                if session is not self.session:
+                    await session.close()
+
+        print("Tor connection failed. Unable to connect through any configured port.")
+        return False
+
+    async def _get_direct_ip(self):
+        try:
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.get(self.ip_check_url) as response:
+                    return (await response.json())['ip']
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error getting direct IP: {e}")
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Invalid response getting direct IP: {e!r}")
+            return None
+
+    async def _get_tor_ip(self, session):
+        async with session.get(self.ip_check_url) as response:
+            return (await response.json())['ip']
+
+    async def _tor_request(self, method, *args, **kwargs):
+        if self.session is None:
+            raise Exception("Tor proxy not configured. Run check_tor_connection() first.")
+        return await self.session.request(method, *args, **kwargs)
+
+    async def _one(self, req):
+        method, url, *rest = req
+        kwargs = rest[0] if rest else {}
+        async with await self._tor_request(method, url, **kwargs) as response:
+            await response.read()
+            return response
+
+    async def get(self, *args, **kwargs):
+        """Make a GET request through Tor"""
+        return await self._tor_request('GET', *args, **kwargs)
+
+    async def post(self, *args, **kwargs):
+        """Make a POST request through Tor"""
+        return await self._tor_request('POST', *args, **kwargs)
+
+    async def put(self, *args, **kwargs):
+        """Make a PUT request through Tor"""
+        return await self._tor_request('PUT', *args, **kwargs)
+
+    async def delete(self, *args, **kwargs):
+        """Make a DELETE request through Tor"""
+        return await self._tor_request('DELETE', *args, **kwargs)
+
+    async def gather(self, reqs):
+        """
+        Make several requests through Tor concurrently.
+
+        Args:
+            reqs (list): Tuples of (method, url) or (method, url, kwargs)
+
+        Returns:
+            list: Responses in the same order as reqs, with bodies already read
+        """
+        return await asyncio.gather(*(self._one(req) for req in reqs))
+
+def async_tor_request(func):
+    """
+    Decorator to automatically handle Tor connection for a coroutine function.
+    The decorated function must accept 'tor' as its first argument after self (if in a class).
+
+    Example:
+        @async_tor_request
+        async def fetch_webpage(tor, url):
+            response = await tor.get(url)
+            return await response.text()
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        async with AsyncTorRequestsWrapper() as tor:
+            if not await tor.check_tor_connection():
+                raise Exception("Tor connection failed. Make sure Tor is running and configured correctly.")
+            return await func(tor, *args, **kwargs)
+    return wrapper
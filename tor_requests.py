@@ -9,6 +9,9 @@ Installation:
 Required packages:
     pip install requests requests[socks]
 
+Optional, for faster JSON decoding with json_fast():
+    pip install orjson
+
 You must also have Tor running on your system:
     - Either Tor Browser (default port 9150)
     - Or Tor service (default port 9050)
@@ -44,30 +47,173 @@ Basic Usage:
 Available HTTP Methods:
 ---------------------
 - get(url, **kwargs)
+- iter_get(url, chunk_size=65536, **kwargs)
 - post(url, **kwargs)
 - put(url, **kwargs)
 - delete(url, **kwargs)
+- head(url, **kwargs)
+- patch(url, **kwargs)
+- options(url, **kwargs)
+- map(method, urls, **kwargs)
+- map_requests(reqs, **kwargs)
 
 All methods support standard requests library kwargs.
+
+Requests share a single requests.Session, so connections through the Tor
+SOCKS proxy are pooled and reused. Use the wrapper as a context manager
+(or call close()) to release them:
+
+    with TorRequestsWrapper() as tor:
+        if tor.check_tor_connection():
+            response = tor.get("https://example.com")
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from functools import wraps
+import random
 import socket
+import threading
+import time
+
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'head', 'patch', 'options')
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+DNS_CACHE_TTL = 900
+_dns_cache = {}
+_original_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, *args, **kwargs):
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    cached = _dns_cache.get(key)
+    if cached and cached[1] > now:
+        return cached[0]
+    result = _original_getaddrinfo(host, port, *args, **kwargs)
+    _dns_cache[key] = (result, now + DNS_CACHE_TTL)
+    return result
+
+def _install_dns_cache():
+    # Process-wide: only local lookups benefit, since socks5h resolves
+    # hostnames at the Tor exit. This covers the direct IP check and any
+    # requests that bypass Tor.
+    if socket.getaddrinfo is not _cached_getaddrinfo:
+        socket.getaddrinfo = _cached_getaddrinfo
 
 class TorRequestsWrapper:
-    def __init__(self, tor_ports=[9150, 9050], timeout=10):
+    # Probe results are shared between instances so repeated wrappers within
+    # the TTL skip the IP checks entirely.
+    cache_ttl = 300
+    _direct_ip_cache = (None, 0.0)
+    _port_ok_cache = {}
+    # fast_check results only prove the port is a working SOCKS5 proxy, so
+    # they are kept apart and never satisfy a full IP check.
+    _socks_ok_cache = {}
+    
+    def __init__(self, tor_ports=(9150, 9050), timeout=20,
+                 pool_connections=10, pool_maxsize=10, max_retries=3,
+                 backoff_base=1.0, backoff_cap=10.0,
+                 enable_dns_cache=False, fast_check=False):
         """
         Initialize the TorRequestsWrapper.
         
         Args:
-            tor_ports (list): List of ports to try for Tor connection. Default [9150, 9050]
-            timeout (int): Request timeout in seconds. Default 10
+            tor_ports (iterable): Ports to try for Tor connection. They are probed
+                concurrently and the first working port to answer is used. Default (9150, 9050)
+            timeout (int): Request timeout in seconds. Default 20
+            pool_connections (int): Number of host pools to cache in the session. Default 10
+            pool_maxsize (int): Maximum connections kept alive per host pool. Default 10
+            max_retries (int): Retries for requests and for each port probe. Default 3
+            backoff_base (float): Initial delay in seconds between port probe retries. Default 1.0
+            backoff_cap (float): Maximum delay in seconds between port probe retries. Default 10.0
+            enable_dns_cache (bool): Cache local DNS lookups process-wide for
+                DNS_CACHE_TTL seconds. Default False
+            fast_check (bool): Verify Tor with a SOCKS5 handshake instead of
+                comparing IPs through ipify. Default False
         """
-        self.tor_ports = tor_ports
+        self.tor_ports = tuple(tor_ports)
         self.timeout = timeout
         self.ip_check_url = 'https://api.ipify.org?format=json'
         self.proxies = None
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.fast_check = fast_check
+        self.socks_check_host = 'check.torproject.org'
+        self.port = None
+        self.session = None
+        self._methods = {}
+        # The direct IP check gates check_tor_connection(), so it fails fast
+        # instead of retrying; only request sessions retry.
+        self._direct_session = self._create_session(max_retries=0)
+        self._sessions = {}
+        self._probe_sessions = {}
+        self._probe_futures = []
+        if enable_dns_cache:
+            _install_dns_cache()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        
+    def close(self):
+        """Close all underlying sessions and release pooled connections"""
+        # Probes left over from _find_port have already been told to stop,
+        # but one may still be mid-request (for up to timeout seconds). Wait
+        # for them so their sessions aren't closed underneath them.
+        wait(self._probe_futures)
+        self._probe_futures.clear()
+        self._direct_session.close()
+        for session in self._sessions.values():
+            session.close()
+        for session in self._probe_sessions.values():
+            session.close()
+        
+    def _create_session(self, proxies=None, max_retries=None):
+        if max_retries is None:
+            max_retries = Retry(
+                total=self.max_retries,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False
+            )
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=max_retries
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if proxies:
+            session.proxies.update(proxies)
+        return session
+        
+    def _get_session(self, port):
+        # Each Tor port keeps its own session and connection pool, so rotating
+        # between ports never tears down an already warm pool.
+        if port not in self._sessions:
+            self._sessions[port] = self._create_session(self._create_proxies(port))
+        return self._sessions[port]
+        
+    def _get_probe_session(self, port):
+        # Port probes retry with their own backoff, so their session must not
+        # retry again underneath.
+        if port not in self._probe_sessions:
+            self._probe_sessions[port] = self._create_session(self._create_proxies(port), max_retries=0)
+        return self._probe_sessions[port]
         
     def _create_proxies(self, port):
         return {
@@ -75,57 +221,212 @@ class TorRequestsWrapper:
             'https': f'socks5h://127.0.0.1:{port}'
         }
         
+    def _use_port(self, port):
+        self.port = port
+        self.proxies = self._create_proxies(port)
+        self.session = self._get_session(port)
+        self._methods = {m: getattr(self.session, m) for m in HTTP_METHODS}
+        
+    def _backoff(self, attempt, stop):
+        # Tor may still be building a circuit, so wait exponentially longer
+        # between attempts, with jitter so concurrent probes don't align.
+        # Returns True if the probe was cancelled while waiting.
+        return stop.wait(min(self.backoff_cap, self.backoff_base * 2 ** attempt) + random.uniform(0, 0.25))
+        
+    def _probe_port(self, port, stop):
+        for attempt in range(self.max_retries + 1):
+            if attempt and self._backoff(attempt - 1, stop):
+                return None
+            try:
+                return self._get_tor_ip(port)
+            except requests.RequestException as e:
+                error = f"Error checking Tor connection on port {port}: {e}"
+            except (ValueError, KeyError, TypeError) as e:
+                error = f"Invalid IP check response on port {port}: {e!r}"
+            except socket.error as e:
+                error = f"Socket error on port {port}: {e}"
+            if stop.is_set():
+                return None
+            print(error)
+        return None
+        
+    def _probe_socks(self, port, stop):
+        """
+        Check a port by asking it, as a SOCKS5 proxy, to open a connection to
+        socks_check_host. Avoids the HTTPS round trip of the IP check.
+        """
+        host = self.socks_check_host.encode()
+        for attempt in range(self.max_retries + 1):
+            if attempt and self._backoff(attempt - 1, stop):
+                return False
+            try:
+                with socket.create_connection(('127.0.0.1', port), timeout=self.timeout) as s:
+                    s.sendall(b'\x05\x01\x00')
+                    if s.recv(2) != b'\x05\x00':
+                        print(f"Port {port} is not a SOCKS5 proxy")
+                        return False
+                    s.sendall(b'\x05\x01\x00\x03' + bytes([len(host)]) + host + (443).to_bytes(2, 'big'))
+                    reply = s.recv(2)
+                    if len(reply) == 2 and reply[1] == 0:
+                        return True
+                    error = f"SOCKS5 connect through port {port} failed"
+            except socket.error as e:
+                error = f"Socket error on port {port}: {e}"
+            if stop.is_set():
+                return False
+            print(error)
+        return False
+        
+    def _accept_port(self, port, tor_ip, direct_ip):
+        if tor_ip and tor_ip != direct_ip:
+            print(f"Connected to Tor! Tor IP: {tor_ip}")
+            TorRequestsWrapper._port_ok_cache[port] = time.monotonic() + self.cache_ttl
+            self._use_port(port)
+            return True
+        return False
+        
+    def _find_port(self, ports):
+        """
+        Probe ports concurrently and switch to the first one that works.
+        
+        Ports are checked with a SOCKS5 handshake when fast_check is set, and
+        otherwise by comparing their Tor IP against the direct IP.
+        """
+        # Set once a port is chosen so probes still retrying on other ports
+        # give up instead of running on in the background. A probe already
+        # mid-request still finishes it (bounded by timeout); close() waits
+        # for those before closing the probe sessions.
+        stop = threading.Event()
+        port_futures = {}
+        executor = ThreadPoolExecutor(max_workers=1 + len(ports))
+        try:
+            if self.fast_check:
+                port_futures = {executor.submit(self._probe_socks, port, stop): port for port in ports}
+                for future in as_completed(port_futures):
+                    if future.result():
+                        port = port_futures[future]
+                        print(f"Connected to Tor on port {port}")
+                        TorRequestsWrapper._socks_ok_cache[port] = time.monotonic() + self.cache_ttl
+                        self._use_port(port)
+                        return True
+                return False
+            
+            direct_future = executor.submit(self._get_direct_ip)
+            port_futures = {executor.submit(self._probe_port, port, stop): port for port in ports}
+            
+            direct_ip = direct_future.result()
+            if not direct_ip:
+                print("Warning: Unable to get direct IP. Continuing with Tor check...")
+            
+            for future in as_completed(port_futures):
+                if self._accept_port(port_futures[future], future.result(), direct_ip):
+                    return True
+            return False
+        finally:
+            stop.set()
+            for pending in port_futures:
+                pending.cancel()
+            executor.shutdown(wait=False)
+            self._probe_futures = [f for f in self._probe_futures if not f.done()]
+            self._probe_futures.extend(f for f in port_futures if not f.done())
+        
     def check_tor_connection(self):
         """
         Verify Tor connection by comparing direct IP with Tor IP.
         
+        The direct IP and every configured port are probed concurrently, and
+        the first port that answers with a Tor IP is used. With fast_check,
+        ports are checked with a SOCKS5 handshake instead.
+        
         Returns:
             bool: True if connected to Tor, False otherwise
         """
-        direct_ip = self._get_direct_ip()
-        if not direct_ip:
-            print("Warning: Unable to get direct IP. Continuing with Tor check...")
-        
+        now = time.monotonic()
+        caches = [TorRequestsWrapper._port_ok_cache]
+        if self.fast_check:
+            caches.append(TorRequestsWrapper._socks_ok_cache)
         for port in self.tor_ports:
-            try:
-                self.proxies = self._create_proxies(port)
-                tor_ip = self._get_tor_ip()
-                if tor_ip and tor_ip != direct_ip:
-                    print(f"Connected to Tor! Tor IP: {tor_ip}")
-                    return True
-            except requests.RequestException as e:
-                print(f"Error checking Tor connection on port {port}: {e}")
-            except socket.error as e:
-                print(f"Socket error on port {port}: {e}")
+            if any(cache.get(port, 0.0) > now for cache in caches):
+                self._use_port(port)
+                return True
+        
+        if self._find_port(self.tor_ports):
+            return True
         
         print("Tor connection failed. Unable to connect through any configured port.")
         return False
         
+    def rotate(self):
+        """
+        Switch to another working Tor port, keeping the current port's pool alive.
+        
+        The other ports are probed the same way as in check_tor_connection(),
+        so the first of them to answer is used.
+        
+        Returns:
+            bool: True if switched to another port, False if none is available
+        """
+        if self.port is None:
+            return self.check_tor_connection()
+        
+        index = self.tor_ports.index(self.port)
+        if self._find_port(self.tor_ports[index + 1:] + self.tor_ports[:index]):
+            return True
+        
+        print(f"No other working Tor port. Staying on port {self.port}.")
+        return False
+        
     def _get_direct_ip(self):
+        ip, expires_at = TorRequestsWrapper._direct_ip_cache
+        if time.monotonic() < expires_at:
+            return ip
         try:
-            response = requests.get(self.ip_check_url, timeout=self.timeout)
-            return response.json()['ip']
+            response = self._direct_session.get(self.ip_check_url, timeout=self.timeout)
+            ip = json_fast(response)['ip']
+            TorRequestsWrapper._direct_ip_cache = (ip, time.monotonic() + self.cache_ttl)
+            return ip
         except requests.RequestException as e:
             print(f"Error getting direct IP: {e}")
             return None
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Invalid response getting direct IP: {e!r}")
+            return None
             
-    def _get_tor_ip(self):
+    def _get_tor_ip(self, port):
         try:
-            response = requests.get(self.ip_check_url, proxies=self.proxies, timeout=self.timeout)
-            return response.json()['ip']
+            response = self._get_probe_session(port).get(self.ip_check_url, timeout=self.timeout)
+            return json_fast(response)['ip']
         except requests.RequestException as e:
             raise
             
     def _tor_request(self, method, *args, **kwargs):
         if not self.proxies:
             raise Exception("Tor proxy not configured. Run check_tor_connection() first.")
-        kwargs['proxies'] = self.proxies
-        return getattr(requests, method)(*args, **kwargs)
+        if method == 'get':
+            kwargs.setdefault('stream', True)
+        return self._methods[method](*args, **kwargs)
         
     def get(self, *args, **kwargs):
-        """Make a GET request through Tor"""
+        """
+        Make a GET request through Tor.
+        
+        The body is streamed (stream=True) unless the caller passes stream=False,
+        so it is only downloaded when accessed. Read the body or close the
+        response (or use it in a with block) to return the connection to the pool.
+        """
         return self._tor_request('get', *args, **kwargs)
         
+    def iter_get(self, url, chunk_size=65536, **kwargs):
+        """
+        Make a GET request through Tor and yield the body in chunks.
+        
+        The response is closed once the generator is exhausted or closed, so
+        stopping early avoids downloading the rest of the body.
+        """
+        kwargs['stream'] = True
+        with self._tor_request('get', url, **kwargs) as response:
+            yield from response.iter_content(chunk_size)
+        
     def post(self, *args, **kwargs):
         """Make a POST request through Tor"""
         return self._tor_request('post', *args, **kwargs)
@@ -137,11 +438,99 @@ class TorRequestsWrapper:
     def delete(self, *args, **kwargs):
         """Make a DELETE request through Tor"""
         return self._tor_request('delete', *args, **kwargs)
+        
+    def head(self, *args, **kwargs):
+        """Make a HEAD request through Tor"""
+        return self._tor_request('head', *args, **kwargs)
+        
+    def patch(self, *args, **kwargs):
+        """Make a PATCH request through Tor"""
+        return self._tor_request('patch', *args, **kwargs)
+        
+    def options(self, *args, **kwargs):
+        """Make an OPTIONS request through Tor"""
+        return self._tor_request('options', *args, **kwargs)
+        
+    def _send(self, request, **kwargs):
+        if not self.proxies:
+            raise Exception("Tor proxy not configured. Run check_tor_connection() first.")
+        kwargs.setdefault('proxies', self.proxies)
+        return self.session.send(self.session.prepare_request(request), **kwargs)
+        
+    def _run_concurrently(self, fn, items, max_workers):
+        if not items:
+            return []
+        # Never use more threads than pooled connections, otherwise the extra
+        # threads just wait for a free connection.
+        if max_workers is None:
+            max_workers = min(len(items), self.pool_maxsize)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, items))
+        
+    def map(self, method, urls, max_workers=None, **kwargs):
+        """
+        Make the same kind of request to several URLs concurrently through Tor.
+        
+        Args:
+            method (str): Lowercase HTTP method name from HTTP_METHODS, e.g. 'get'
+            urls (list): URLs to request
+            max_workers (int): Number of threads. Default min(len(urls), pool_maxsize)
+            **kwargs: Passed to every request
+            
+        Returns:
+            list: Responses in the same order as urls
+        """
+        # Download bodies in the worker threads rather than later, one at a
+        # time, on the caller's thread.
+        kwargs.setdefault('stream', False)
+        return self._run_concurrently(
+            lambda url: self._tor_request(method, url, **kwargs), list(urls), max_workers
+        )
+        
+    def map_requests(self, reqs, max_workers=None, **kwargs):
+        """
+        Send several requests.Request objects concurrently through Tor.
+        
+        Args:
+            reqs (list): requests.Request objects, which may use different methods
+            max_workers (int): Number of threads. Default min(len(reqs), pool_maxsize)
+            **kwargs: Passed to Session.send, e.g. timeout
+            
+        Returns:
+            list: Responses in the same order as reqs
+        """
+        return self._run_concurrently(
+            lambda req: self._send(req, **kwargs), list(reqs), max_workers
+        )
+
+def json_fast(response):
+    """
+    Decode a JSON response body, using orjson when it is installed.
+    
+    Faster drop-in for response.json() on large bodies.
+    """
+    return _json_loads(response.content)
+
+_shared = None
+_shared_lock = threading.Lock()
+
+def _get_shared_wrapper():
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            tor = TorRequestsWrapper()
+            if not tor.check_tor_connection():
+                tor.close()
+                raise Exception("Tor connection failed. Make sure Tor is running and configured correctly.")
+            _shared = tor
+        return _shared
 
 def tor_request(func):
     """
     Decorator to automatically handle Tor connection for a function.
     The decorated function must accept 'tor' as its first argument after self (if in a class).
+    A single connected wrapper is shared by all decorated calls, so its pooled
+    connections are reused instead of being set up again on every call.
     
     Example:
         @tor_request
@@ -151,10 +540,7 @@ def tor_request(func):
     """
     @wraps(func)
     def wrapper(*args, **kwargs):
-        tor = TorRequestsWrapper()
-        if not tor.check_tor_connection():
-            raise Exception("Tor connection failed. Make sure Tor is running and configured correctly.")
-        return func(tor, *args, **kwargs)
+        return func(_get_shared_wrapper(), *args, **kwargs)
     return wrapper
 
 